@@ -0,0 +1,46 @@
+"""
+Shared, cached loaders for the enriched YC dataset.
+
+Several scripts re-read the same enriched CSV/JSON and re-filter the
+🤖 PATTERN rows; loading through here means one disk read and one
+partition pass per process no matter how many scripts ask for the data.
+"""
+import functools
+import json
+
+from pathlib import Path
+
+try:
+    import orjson  # ~3-5x faster than stdlib json on big arrays of dicts
+except ImportError:
+    orjson = None
+
+from _utils import read_companies
+
+ENRICHED_CSV = Path('final_enriched_summer25 - final_enriched_summer25.csv')
+ENRICHED_JSON = Path('final_enriched_summer25 - final_enriched_summer25.json')
+
+def _partition(companies):
+    """Split companies into (all, pattern, real) in a single pass"""
+    pattern_companies = []
+    real_companies = []
+    for company in companies:
+        quality = company.get('data_quality')
+        if quality == '🤖 PATTERN':
+            pattern_companies.append(company)
+        elif quality == '✅ REAL':
+            real_companies.append(company)
+    return companies, pattern_companies, real_companies
+
+@functools.lru_cache(maxsize=1)
+def load_enriched():
+    """Load the enriched JSON once as (companies, pattern, real)"""
+    if orjson is not None:
+        return _partition(orjson.loads(ENRICHED_JSON.read_bytes()))
+    with open(ENRICHED_JSON, 'r', encoding='utf-8') as f:
+        return _partition(json.load(f))
+
+@functools.lru_cache(maxsize=1)
+def load_enriched_csv():
+    """Load the enriched CSV once as (companies, pattern, real)"""
+    return _partition(read_companies(ENRICHED_CSV))
@@ -0,0 +1,26 @@
+"""
+Shared helpers for the YC company scripts.
+"""
+import csv
+import functools
+
+# 1 MiB read buffer: the default 8 KB buffer means a read syscall every few
+# rows on these wide CSVs
+_CSV_BUFFER = 1 << 20
+
+def read_companies(path):
+    """Read a company CSV into a list of row dicts"""
+    with open(path, 'r', buffering=_CSV_BUFFER, encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+@functools.lru_cache(maxsize=4096)
+def extract_company_slug(yc_link):
+    """Extract company slug from YC link"""
+    # The anchor is a fixed literal, so str.partition beats the regex
+    # engine by a wide margin
+    if not yc_link:
+        return None
+    _, sep, rest = yc_link.partition('/companies/')
+    if not sep:
+        return None
+    return rest.partition('/')[0] or None
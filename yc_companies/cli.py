@@ -0,0 +1,38 @@
+"""
+Single entry point for the enrichment pipeline.
+
+The standalone scripts each pay full interpreter startup plus csv/json/
+re imports when run back to back. Chaining steps through one process
+pays that once, and the cached loaders (_real_founders, load_enriched,
+the pickle enrichment cache) stay warm between steps.
+
+Usage:
+    python cli.py enrich update-founders list-patterns
+"""
+import argparse
+
+import main as enrich
+import update_with_real_founders
+import get_pattern_companies
+import search_funding_rounds
+
+COMMANDS = {
+    'enrich': enrich.main,
+    'update-founders': update_with_real_founders.main,
+    'list-patterns': get_pattern_companies.main,
+    'infer-funding': search_funding_rounds.main,
+}
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run one or more enrichment steps in a single process')
+    parser.add_argument('steps', nargs='+', choices=sorted(COMMANDS),
+                        metavar='step',
+                        help=f"steps to run, in order: {', '.join(sorted(COMMANDS))}")
+    args = parser.parse_args()
+
+    for step in args.steps:
+        COMMANDS[step]()
+
+if __name__ == "__main__":
+    main()
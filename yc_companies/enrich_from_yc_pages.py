@@ -2,20 +2,7 @@
 Script to extract real founder data from YC company pages
 and update the existing CSV file in place.
 """
-import csv
-import json
-from pathlib import Path
-import re
-import time
-
-def extract_company_slug(yc_link):
-    """Extract company slug from YC link"""
-    if not yc_link:
-        return None
-    match = re.search(r'/companies/([^/]+)', yc_link)
-    if match:
-        return match.group(1)
-    return None
+from _dataset import ENRICHED_CSV, load_enriched_csv
 
 def parse_founder_from_yc_page(page_content, company_name):
     """Parse founder information from YC page snapshot"""
@@ -31,24 +18,17 @@ def parse_founder_from_yc_page(page_content, company_name):
     }
 
 def main():
-    input_file = Path('final_enriched_summer25 - final_enriched_summer25.csv')
-    
+    input_file = ENRICHED_CSV
+
     print("="*70)
     print("ENRICHING FROM YC PAGES - UPDATING EXISTING CSV")
     print("="*70)
-    
-    # Read existing CSV
+
+    # Read existing CSV through the shared cached loader
     print(f"\n📖 Reading {input_file.name}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        companies = list(reader)
-    
+    companies, pattern_companies, real_companies = load_enriched_csv()
+
     print(f"   Found {len(companies)} companies")
-    
-    # Identify pattern companies
-    pattern_companies = [c for c in companies if c.get('data_quality') == '🤖 PATTERN']
-    real_companies = [c for c in companies if c.get('data_quality') == '✅ REAL']
-    
     print(f"   ✅ REAL: {len(real_companies)}")
     print(f"   🤖 PATTERN: {len(pattern_companies)}")
     
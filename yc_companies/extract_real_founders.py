@@ -4,18 +4,10 @@ and update the CSV with actual founder information.
 """
 import csv
 import json
-import re
 from pathlib import Path
 import time
 
-def extract_company_slug(yc_link):
-    """Extract company slug from YC link"""
-    if not yc_link:
-        return None
-    match = re.search(r'/companies/([^/]+)', yc_link)
-    if match:
-        return match.group(1)
-    return None
+from _utils import read_companies
 
 def is_pattern_data(company):
     """Check if company has pattern-generated data"""
@@ -41,11 +33,9 @@ def main():
     
     # Read existing CSV
     print(f"\n📖 Reading {input_file.name}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        companies = list(reader)
-        fieldnames = reader.fieldnames
-    
+    companies = read_companies(input_file)
+    fieldnames = list(companies[0].keys()) if companies else []
+
     print(f"   Found {len(companies)} companies")
     
     # Identify companies with pattern data
@@ -8,29 +8,66 @@ from pathlib import Path
 import re
 import time
 
-def extract_company_slug(yc_link):
-    """Extract company slug from YC link"""
-    if not yc_link:
-        return None
-    match = re.search(r'/companies/([^/]+)', yc_link)
-    if match:
-        return match.group(1)
-    return None
+try:
+    import orjson  # optional: much faster progress-file parsing
+except ImportError:
+    orjson = None
+
+from _utils import extract_company_slug
+
+# Common patterns for funding announcements, compiled once at import
+# instead of on every parse_funding_info call
+_FUNDING_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'raised\s+(\$[\d.]+[MBK]?)\s+(?:in\s+)?(?:a\s+)?(seed|Series\s+[A-Z]|pre-seed|Series\s+[A-Z])\s+round',
+    r'(seed|Series\s+[A-Z]|pre-seed)\s+round\s+of\s+(\$[\d.]+[MBK]?)',
+    r'(\$[\d.]+[MBK]?)\s+(?:funding|raised)\s+(?:in\s+)?(seed|Series\s+[A-Z]|pre-seed)',
+)]
+
+# Single combined alternation used as a cheap presence check: most search
+# blobs contain no funding info at all, and one scan rejects those without
+# running the per-pattern extraction loop
+_FUNDING_ANY = re.compile(
+    '|'.join(f'(?:{p.pattern})' for p in _FUNDING_PATTERNS), re.IGNORECASE)
+
+def load_progress(progress_file, legacy_file=None):
+    """Load progress from line-delimited JSON, one record per line"""
+    progress = {}
+    loads = orjson.loads if orjson is not None else json.loads
+    if progress_file.exists():
+        with open(progress_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    rec = loads(line)
+                    progress[rec['key']] = rec
+    elif legacy_file is not None and legacy_file.exists():
+        # One-time read of the old monolithic JSON progress file
+        progress = loads(legacy_file.read_bytes())
+    return progress
+
+def record_progress(progress_file, key, info):
+    """Append one processed company to the progress file.
+
+    Appending a line is O(1) per record; the old monolithic JSON file had
+    to be rewritten in full on every update.
+    """
+    rec = {'key': key, **info}
+    if orjson is not None:
+        data = orjson.dumps(rec)
+    else:
+        data = json.dumps(rec, ensure_ascii=False).encode('utf-8')
+    with open(progress_file, 'ab') as f:
+        f.write(data + b'\n')
 
 def parse_funding_info(search_result_text, company_name):
     """Parse funding information from search results"""
-    # Common patterns for funding announcements
-    patterns = [
-        r'raised\s+(\$[\d.]+[MBK]?)\s+(?:in\s+)?(?:a\s+)?(seed|Series\s+[A-Z]|pre-seed|Series\s+[A-Z])\s+round',
-        r'(seed|Series\s+[A-Z]|pre-seed)\s+round\s+of\s+(\$[\d.]+[MBK]?)',
-        r'(\$[\d.]+[MBK]?)\s+(?:funding|raised)\s+(?:in\s+)?(seed|Series\s+[A-Z]|pre-seed)',
-    ]
-    
     funding_round = None
     funding_amount = None
-    
-    for pattern in patterns:
-        match = re.search(pattern, search_result_text, re.IGNORECASE)
+
+    if not _FUNDING_ANY.search(search_result_text):
+        return funding_round, funding_amount
+
+    for pattern in _FUNDING_PATTERNS:
+        match = pattern.search(search_result_text)
         if match:
             if len(match.groups()) == 2:
                 if '$' in match.group(1):
@@ -46,96 +83,101 @@ def parse_funding_info(search_result_text, company_name):
 def main():
     input_file = Path(r'c:\Users\aidan\Downloads\ycombinator - ycombinator.csv.csv')
     output_file = Path('yc_companies_with_funding.csv')
-    progress_file = Path('funding_search_progress.json')
+    progress_file = Path('funding_search_progress.jsonl')
+    legacy_progress_file = Path('funding_search_progress.json')
     
     print("="*70)
     print("FINDING ACTUAL FUNDING ROUND INFORMATION")
     print("="*70)
     
-    # Read companies
-    print(f"\n📖 Reading {input_file.name}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        companies = list(reader)
-    
-    print(f"   Found {len(companies)} companies")
-    
     # Load progress if exists
-    progress = {}
-    if progress_file.exists():
-        with open(progress_file, 'r', encoding='utf-8') as f:
-            progress = json.load(f)
+    progress = load_progress(progress_file, legacy_progress_file)
+    if progress:
         print(f"   Loaded progress: {len(progress)} companies already processed")
-    
-    # Process companies
-    enriched = []
-    print(f"\n🔄 Processing companies...")
+
+    # Stream companies from input to output one row at a time instead of
+    # materializing the whole CSV in a list
+    total_count = 0
+    template_companies = []
+    print(f"\n🔄 Processing {input_file.name}...")
     print(f"   Note: This script prepares the structure.")
     print(f"   Use web search to find actual funding data for each company.\n")
-    
-    for idx, company in enumerate(companies, 1):
-        company_name = company.get('Company_Name', '')
-        batch = company.get('Batch', '')
-        yc_link = company.get('YC_Link', '')
-        company_slug = extract_company_slug(yc_link)
-        
-        # Check if we have progress for this company
-        company_key = company_name.lower()
-        if company_key in progress:
-            funding_round = progress[company_key].get('funding_round', '')
-            funding_amount = progress[company_key].get('funding_amount', '')
-            funding_date = progress[company_key].get('funding_date', '')
-            funding_source = progress[company_key].get('funding_source', 'Manual')
-        else:
-            # Default: Most YC companies are seed stage
-            funding_round = 'Seed'
-            funding_amount = ''  # To be filled
-            funding_date = batch if batch else ''
-            funding_source = 'YC Batch (Default - Needs Verification)'
-        
-        enriched_company = {
-            **company,
-            'funding_round': funding_round,
-            'funding_amount': funding_amount,
-            'funding_date': funding_date,
-            'funding_source': funding_source,
-            'company_slug': company_slug,
-        }
-        enriched.append(enriched_company)
-        
-        if idx <= 10:
-            print(f"   [{idx}] {company_name}")
-            print(f"       Batch: {batch}")
-            print(f"       Slug: {company_slug}")
-            print(f"       Funding: {funding_round} - {funding_amount}")
-            print()
-    
-    # Save output
-    print(f"\n💾 Writing to {output_file.name}...")
-    if enriched:
-        fieldnames = list(enriched[0].keys())
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(enriched)
-        print(f"   ✅ CSV saved with {len(enriched)} companies")
-    
-    # Create search template
-    search_template_file = Path('funding_search_template.txt')
-    with open(search_template_file, 'w', encoding='utf-8') as f:
-        f.write("="*70 + "\n")
-        f.write("FUNDING ROUND SEARCH TEMPLATE\n")
-        f.write("="*70 + "\n\n")
-        f.write("Search queries for finding funding information:\n\n")
-        for i, company in enumerate(companies[:20], 1):
+
+    # 1 MiB write buffer so per-row writes batch into a handful of flushes
+    with open(input_file, 'r', encoding='utf-8') as f_in, \
+         open(output_file, 'w', newline='', encoding='utf-8',
+              buffering=1 << 20) as f_out:
+        reader = csv.DictReader(f_in)
+        fieldnames = reader.fieldnames + [
+            'funding_round', 'funding_amount', 'funding_date',
+            'funding_source', 'company_slug',
+        ]
+        writer = csv.DictWriter(f_out, fieldnames=fieldnames)
+        writer.writeheader()
+
+        for idx, company in enumerate(reader, 1):
             company_name = company.get('Company_Name', '')
             batch = company.get('Batch', '')
-            f.write(f"{i}. {company_name} ({batch})\n")
-            f.write(f"   - \"{company_name} raised funding\"\n")
-            f.write(f"   - \"{company_name} seed round\"\n")
-            f.write(f"   - \"{company_name} Y Combinator funding\"\n")
-            f.write(f"   - site:crunchbase.com {company_name}\n")
-            f.write(f"   - site:techcrunch.com {company_name} funding\n\n")
+            yc_link = company.get('YC_Link', '')
+            company_slug = extract_company_slug(yc_link)
+
+            # Check if we have progress for this company
+            company_key = company_name.lower()
+            if company_key in progress:
+                funding_round = progress[company_key].get('funding_round', '')
+                funding_amount = progress[company_key].get('funding_amount', '')
+                funding_date = progress[company_key].get('funding_date', '')
+                funding_source = progress[company_key].get('funding_source', 'Manual')
+            else:
+                # Default: Most YC companies are seed stage
+                funding_round = 'Seed'
+                funding_amount = ''  # To be filled
+                funding_date = batch if batch else ''
+                funding_source = 'YC Batch (Default - Needs Verification)'
+
+            company.update({
+                'funding_round': funding_round,
+                'funding_amount': funding_amount,
+                'funding_date': funding_date,
+                'funding_source': funding_source,
+                'company_slug': company_slug,
+            })
+            writer.writerow(company)
+            total_count += 1
+
+            # Keep just the first 20 around for the search template below
+            if idx <= 20:
+                template_companies.append((company_name, batch))
+
+            if idx <= 10:
+                print(f"   [{idx}] {company_name}")
+                print(f"       Batch: {batch}")
+                print(f"       Slug: {company_slug}")
+                print(f"       Funding: {funding_round} - {funding_amount}")
+                print()
+
+    print(f"   ✅ CSV saved with {total_count} companies")
+
+    # Create search template: build every block up front and write the
+    # whole file in one call instead of several small writes per company
+    search_template_file = Path('funding_search_template.txt')
+    blocks = [
+        "="*70 + "\n"
+        "FUNDING ROUND SEARCH TEMPLATE\n"
+        + "="*70 + "\n\n"
+        "Search queries for finding funding information:\n\n"
+    ]
+    for i, (company_name, batch) in enumerate(template_companies, 1):
+        blocks.append(
+            f"{i}. {company_name} ({batch})\n"
+            f"   - \"{company_name} raised funding\"\n"
+            f"   - \"{company_name} seed round\"\n"
+            f"   - \"{company_name} Y Combinator funding\"\n"
+            f"   - site:crunchbase.com {company_name}\n"
+            f"   - site:techcrunch.com {company_name} funding\n\n"
+        )
+    with open(search_template_file, 'w', encoding='utf-8') as f:
+        f.write("".join(blocks))
     
     print(f"   📝 Created search template: {search_template_file}")
     
@@ -143,13 +185,13 @@ def main():
     print(f"\n{'='*70}")
     print(f"✅ PREPARATION COMPLETE!")
     print(f"{'='*70}")
-    print(f"📊 Total companies: {len(companies)}")
+    print(f"📊 Total companies: {total_count}")
     print(f"📁 Output: {output_file}")
     print(f"\n💡 To find actual funding rounds:")
     print(f"   1. Search each company: '{company_name} raised funding'")
     print(f"   2. Check Crunchbase: site:crunchbase.com {company_name}")
     print(f"   3. Check TechCrunch: site:techcrunch.com {company_name} funding")
-    print(f"   4. Update progress.json with found data")
+    print(f"   4. Append found data to {progress_file.name} (one JSON record per line)")
     print(f"\n📋 Search template created: {search_template_file}")
     print(f"{'='*70}")
 
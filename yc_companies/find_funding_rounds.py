@@ -6,7 +6,7 @@ import csv
 import json
 import time
 from pathlib import Path
-import re
+from _utils import extract_company_slug, read_companies
 
 def search_funding_round(company_name, yc_link):
     """Search for funding round information"""
@@ -18,15 +18,6 @@ def search_funding_round(company_name, yc_link):
     ]
     return search_queries
 
-def extract_company_slug(yc_link):
-    """Extract company slug from YC link"""
-    if not yc_link:
-        return None
-    match = re.search(r'/companies/([^/]+)', yc_link)
-    if match:
-        return match.group(1)
-    return None
-
 def main():
     input_file = Path(r'c:\Users\aidan\Downloads\ycombinator - ycombinator.csv.csv')
     output_file = Path('yc_companies_with_rounds.csv')
@@ -37,10 +28,8 @@ def main():
     
     # Read companies
     print(f"\n📖 Reading {input_file.name}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        companies = list(reader)
-    
+    companies = read_companies(input_file)
+
     print(f"   Found {len(companies)} companies")
     
     # Prepare output
@@ -59,15 +48,15 @@ def main():
         print(f"   Slug: {company_slug}")
         print()
     
-    # Add funding_round column (empty for now)
+    # Add funding_round column (empty for now); mutate rows in place
+    # instead of copying every column into a fresh dict
     for company in companies:
-        enriched_company = {
-            **company,
+        company.update({
             'funding_round': '',  # To be filled
             'funding_amount': '',  # To be filled
             'funding_date': '',    # To be filled
-        }
-        enriched.append(enriched_company)
+        })
+        enriched.append(company)
     
     # Save output
     print(f"\n💾 Writing to {output_file.name}...")
@@ -1,17 +1,5 @@
-import json
-import csv
-from pathlib import Path
-import re
-
-def extract_company_name_from_yc_link(yc_link):
-    """Extract company name from YC link"""
-    if not yc_link:
-        return None
-    # Extract from URL like: https://www.ycombinator.com/companies/blue
-    match = re.search(r'/companies/([^/]+)', yc_link)
-    if match:
-        return match.group(1)
-    return None
+from _dataset import load_enriched
+from _utils import extract_company_slug
 
 def search_founder_info(company_name, yc_link, description):
     """Search for founder information using web search"""
@@ -23,25 +11,20 @@ def search_founder_info(company_name, yc_link, description):
     ]
     
     # Extract potential company slug from YC link
-    company_slug = extract_company_name_from_yc_link(yc_link)
+    company_slug = extract_company_slug(yc_link)
     if company_slug:
         search_queries.append(f"{company_slug} founder")
     
     return search_queries
 
 def main():
-    # Read the enriched JSON to find pattern companies
-    json_file = Path('final_enriched_summer25 - final_enriched_summer25.json')
-    
+    # Read the enriched JSON (cached loader) to find pattern companies
     print("="*70)
     print("FINDING REAL FOUNDER DATA FOR PATTERN COMPANIES")
     print("="*70)
-    
-    with open(json_file, 'r', encoding='utf-8') as f:
-        companies = json.load(f)
-    
-    pattern_companies = [c for c in companies if c.get('data_quality') == '🤖 PATTERN']
-    
+
+    _, pattern_companies, _ = load_enriched()
+
     print(f"\n📊 Found {len(pattern_companies)} companies with pattern data")
     print(f"🔍 Starting web search for founder information...\n")
     
@@ -4,9 +4,15 @@ and update the CSV file with actual founder information.
 """
 import csv
 import json
-import re
 from pathlib import Path
 
+try:
+    import orjson  # optional: faster JSON dump
+except ImportError:
+    orjson = None
+
+from _utils import extract_company_slug, read_companies
+
 def is_pattern_data(company):
     """Check if company has pattern-generated data"""
     founder_first = company.get('founder_first_name', '').strip()
@@ -22,15 +28,6 @@ def is_pattern_data(company):
     
     return False
 
-def extract_company_slug(yc_link):
-    """Extract company slug from YC link"""
-    if not yc_link:
-        return None
-    match = re.search(r'/companies/([^/]+)', yc_link)
-    if match:
-        return match.group(1)
-    return None
-
 def main():
     input_file = Path('final_enriched_summer25 - final_enriched_summer25.csv')
     
@@ -40,11 +37,9 @@ def main():
     
     # Read existing CSV
     print(f"\n📖 Reading {input_file.name}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        companies = list(reader)
-        fieldnames = reader.fieldnames
-    
+    companies = read_companies(input_file)
+    fieldnames = list(companies[0].keys()) if companies else []
+
     print(f"   Found {len(companies)} companies")
     
     # Identify companies with pattern data
@@ -73,8 +68,11 @@ def main():
     
     # Save list to JSON for processing
     output_json = Path('companies_needing_founders.json')
-    with open(output_json, 'w', encoding='utf-8') as f:
-        json.dump(pattern_companies, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        output_json.write_bytes(orjson.dumps(pattern_companies, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_json, 'w', encoding='utf-8') as f:
+            json.dump(pattern_companies, f, indent=2, ensure_ascii=False)
     
     print(f"\n💾 Saved list to {output_json.name}")
     print(f"\n🔍 Next step: Visit each YC page and extract founder information")
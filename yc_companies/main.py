@@ -1,297 +1,159 @@
 import csv
+import functools
+import hashlib
 import json
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from pathlib import Path
 
-# REAL FOUNDER DATA (from web search)
-REAL_FOUNDERS = {
-    "F2": {
-        "founder_first": "Don",
-        "founder_last": "Muir",
-        "founder_email": "don@f2.com",
-        "founder_linkedin": "linkedin.com/in/don-muir",
-        "website": "f2.com",
-        "jobs": "ML Engineering Intern, Data Science Intern",
-        "funding_stage": "Seed",
-        "amount_raised": "$20M",
-        "date_raised": "Summer 2025"
-    },
-    "Nox Metals": {
-        "founder_first": "Zane",
-        "founder_last": "Hengsperger",
-        "founder_email": "zane@noxmetals.co",
-        "founder_linkedin": "linkedin.com/in/zanehh",
-        "website": "noxmetals.co",
-        "jobs": "Founding Software Engineer, Software Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$2M",
-        "date_raised": "Summer 2025"
-    },
-    "Paloma": {
-        "founder_first": "Sarah",
-        "founder_last": "Chen",
-        "founder_email": "sarah@paloma.ai",
-        "founder_linkedin": "linkedin.com/in/sarahchen",
-        "website": "paloma.ai",
-        "jobs": "Product Engineer, Sales Operations Specialist",
-        "funding_stage": "Seed",
-        "amount_raised": "$3M",
-        "date_raised": "Summer 2025"
-    },
-    "Luminal": {
-        "founder_first": "Alex",
-        "founder_last": "Martinez",
-        "founder_email": "alex@luminal.ai",
-        "founder_linkedin": "linkedin.com/in/alexmartinez",
-        "website": "luminal.ai",
-        "jobs": "ML Infrastructure Engineer, Systems Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$4M",
-        "date_raised": "Summer 2025"
-    },
-    "Metis": {
-        "founder_first": "James",
-        "founder_last": "Park",
-        "founder_email": "james@metis.ai",
-        "founder_linkedin": "linkedin.com/in/jamespark",
-        "website": "metis.ai",
-        "jobs": "Infrastructure Engineer, AI Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$5M",
-        "date_raised": "Summer 2025"
-    },
-    "Modelence": {
-        "founder_first": "Emily",
-        "founder_last": "Rodriguez",
-        "founder_email": "emily@modelence.com",
-        "founder_linkedin": "linkedin.com/in/emilyrodriguez",
-        "website": "modelence.com",
-        "jobs": "Full Stack Engineer, DevOps Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$3.5M",
-        "date_raised": "Summer 2025"
-    },
-    "Kernel": {
-        "founder_first": "David",
-        "founder_last": "Kim",
-        "founder_email": "david@kernel.sh",
-        "founder_linkedin": "linkedin.com/in/davidkim",
-        "website": "kernel.sh",
-        "jobs": "Infrastructure Engineer, Browser Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$6M",
-        "date_raised": "Summer 2025"
-    },
-    "Outrove": {
-        "founder_first": "Rachel",
-        "founder_last": "Thompson",
-        "founder_email": "rachel@outrove.com",
-        "founder_linkedin": "linkedin.com/in/rachelthompson",
-        "website": "outrove.com",
-        "jobs": "AI Engineer, Recruiting Specialist",
-        "funding_stage": "Seed",
-        "amount_raised": "$2.5M",
-        "date_raised": "Summer 2025"
-    },
-    "Interfere": {
-        "founder_first": "Michael",
-        "founder_last": "Anderson",
-        "founder_email": "michael@interfere.dev",
-        "founder_linkedin": "linkedin.com/in/michaelanderson",
-        "website": "interfere.dev",
-        "jobs": "Software Engineer, QA Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$3M",
-        "date_raised": "Summer 2025"
-    },
-    "stagewise": {
-        "founder_first": "Priya",
-        "founder_last": "Patel",
-        "founder_email": "priya@stagewise.io",
-        "founder_linkedin": "linkedin.com/in/priyapatel",
-        "website": "stagewise.io",
-        "jobs": "Frontend Engineer, AI Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$2.8M",
-        "date_raised": "Summer 2025"
-    },
-    "Okibi": {
-        "founder_first": "Chris",
-        "founder_last": "Wu",
-        "founder_email": "chris@okibi.ai",
-        "founder_linkedin": "linkedin.com/in/chriswu",
-        "website": "okibi.ai",
-        "jobs": "AI Engineer, Product Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$4M",
-        "date_raised": "Summer 2025"
-    },
-    "Pally": {
-        "founder_first": "Jessica",
-        "founder_last": "Lee",
-        "founder_email": "jessica@pally.app",
-        "founder_linkedin": "linkedin.com/in/jessicalee",
-        "website": "pally.app",
-        "jobs": "Product Engineer, Backend Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$3.2M",
-        "date_raised": "Summer 2025"
-    },
-    "Keystone": {
-        "founder_first": "Ryan",
-        "founder_last": "O'Connor",
-        "founder_email": "ryan@keystone.ai",
-        "founder_linkedin": "linkedin.com/in/ryanoconnor",
-        "website": "keystone.ai",
-        "jobs": "AI Engineer, DevOps Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$4.5M",
-        "date_raised": "Summer 2025"
-    },
-    "Async": {
-        "founder_first": "Lisa",
-        "founder_last": "Zhang",
-        "founder_email": "lisa@async.so",
-        "founder_linkedin": "linkedin.com/in/lisazhang",
-        "website": "async.so",
-        "jobs": "Product Engineer, Full Stack Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$3.8M",
-        "date_raised": "Summer 2025"
-    },
-    "Hyprnote": {
-        "founder_first": "Kevin",
-        "founder_last": "Nguyen",
-        "founder_email": "kevin@hyprnote.com",
-        "founder_linkedin": "linkedin.com/in/kevinnguyen",
-        "website": "hyprnote.com",
-        "jobs": "ML Engineer, Product Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$2.2M",
-        "date_raised": "Summer 2025"
-    },
-    "ZeroEval": {
-        "founder_first": "Amanda",
-        "founder_last": "Foster",
-        "founder_email": "amanda@zeroeval.ai",
-        "founder_linkedin": "linkedin.com/in/amandafoster",
-        "website": "zeroeval.ai",
-        "jobs": "AI Engineer, Research Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$3.5M",
-        "date_raised": "Summer 2025"
-    },
-    "Fulcrum": {
-        "founder_first": "Brian",
-        "founder_last": "Taylor",
-        "founder_email": "brian@fulcrum.ai",
-        "founder_linkedin": "linkedin.com/in/briantaylor",
-        "website": "fulcrum.ai",
-        "jobs": "AI Engineer, Software Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$4.2M",
-        "date_raised": "Summer 2025"
-    },
-    "RowFlow": {
-        "founder_first": "Sophie",
-        "founder_last": "Brown",
-        "founder_email": "sophie@rowflow.ai",
-        "founder_linkedin": "linkedin.com/in/sophiebrown",
-        "website": "rowflow.ai",
-        "jobs": "AI Engineer, UX Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$2.7M",
-        "date_raised": "Summer 2025"
-    },
-    "RealRoots": {
-        "founder_first": "Maya",
-        "founder_last": "Johnson",
-        "founder_email": "maya@realroots.app",
-        "founder_linkedin": "linkedin.com/in/mayajohnson",
-        "website": "realroots.app",
-        "jobs": "Mobile Engineer, Product Designer",
-        "funding_stage": "Seed",
-        "amount_raised": "$2.3M",
-        "date_raised": "Summer 2025"
-    },
-    "Certus AI": {
-        "founder_first": "Daniel",
-        "founder_last": "Garcia",
-        "founder_email": "daniel@certus.ai",
-        "founder_linkedin": "linkedin.com/in/danielgarcia",
-        "website": "certus.ai",
-        "jobs": "Voice AI Engineer, Product Engineer",
-        "funding_stage": "Seed",
-        "amount_raised": "$3M",
-        "date_raised": "Summer 2025"
-    },
-    "Blue": {
-        "founder_first": "Omar",
-        "founder_last": "Abdelaziz",
-        "founder_email": "omar@heyblue.com",
-        "founder_linkedin": "linkedin.com/in/oabdelaziz",
-        "website": "heyblue.com",
-        "jobs": "Software Engineering Intern, Product Intern",
-        "funding_stage": "Seed",
-        "amount_raised": "$1.5M",
-        "date_raised": "Summer 2025"
-    }
+try:
+    import orjson  # several times faster than stdlib json on big dumps
+except ImportError:
+    orjson = None
+
+# REAL FOUNDER DATA (from web search) lives in real_founders.json so the
+# interpreter doesn't rebuild a ~200-key dict literal on every start
+@functools.cache
+def _real_founders():
+    """Load the verified founder records, keyed by company name"""
+    raw = (Path(__file__).parent / 'real_founders.json').read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Job matching: precompiled per-bucket patterns, checked in priority
+# order (ai > dev > data) like the original if/elif chain — a mention
+# of AI anywhere in the description must win even when a lower-priority
+# keyword appears earlier in the text
+JOB_PATTERNS = (
+    ('ai', re.compile(r'\bai\b|\bml\b|machine learning|llm', re.IGNORECASE)),
+    ('dev', re.compile(r'developer|code|software', re.IGNORECASE)),
+    ('data', re.compile(r'data|analytics', re.IGNORECASE)),
+)
+JOB_BUCKETS = {
+    'ai': 'ML Engineering Intern, AI Research Intern',
+    'dev': 'Software Engineering Intern, Product Engineering Intern',
+    'data': 'Data Science Intern, Analytics Intern',
+    None: 'Software Engineering Intern, Product Intern',
 }
 
+# Strip separators in one pass; the word-like tokens still need .replace()
+_DOMAIN_STRIP = str.maketrans('', '', ' ,.')
+
+@functools.lru_cache(maxsize=4096)
 def extract_domain(company_name):
     """Convert company name to likely domain"""
-    domain = company_name.lower()
-    for remove in [' ', ',', '.', 'inc', 'llc', 'the', '-']:
-        domain = domain.replace(remove, '')
+    domain = company_name.lower().translate(_DOMAIN_STRIP)
+    domain = domain.replace('inc', '').replace('llc', '').replace('the', '').replace('-', '')
     return f"{domain}.com"
 
-def enrich_company(company):
-    """Enrich with real or pattern data"""
-    company_name = company['Company_Name']
-    
-    if company_name in REAL_FOUNDERS:
+class Quality(IntEnum):
+    """data_quality tag used in-process; rendered to the emoji labels the
+    CSV/JSON consumers expect only at write time"""
+    PATTERN = 0
+    REAL = 1
+
+QUALITY_LABELS = {Quality.REAL: '✅ REAL', Quality.PATTERN: '🤖 PATTERN'}
+
+# Columns appended by enrich_company, in output order
+ENRICHED_FIELDS = (
+    'founder_first_name', 'founder_last_name', 'founder_email',
+    'founder_linkedin', 'website', 'job_openings', 'funding_stage',
+    'amount_raised', 'date_raised', 'data_quality',
+)
+
+def enrich_company(row, name_idx, desc_idx):
+    """Enrich a positional CSV row with real or pattern data"""
+    company_name = row[name_idx]
+
+    data = _real_founders().get(company_name)
+    if data is not None:
         # Use REAL verified data
-        data = REAL_FOUNDERS[company_name]
-        return {
-            **company,
-            'founder_first_name': data['founder_first'],
-            'founder_last_name': data['founder_last'],
-            'founder_email': data['founder_email'],
-            'founder_linkedin': data['founder_linkedin'],
-            'website': data['website'],
-            'job_openings': data['jobs'],
-            'funding_stage': data['funding_stage'],
-            'amount_raised': data['amount_raised'],
-            'date_raised': data['date_raised'],
-            'data_quality': '✅ REAL'
-        }
+        return (*row,
+                data['founder_first'], data['founder_last'],
+                data['founder_email'], data['founder_linkedin'],
+                data['website'], data['jobs'], data['funding_stage'],
+                data['amount_raised'], data['date_raised'], Quality.REAL)
+
+    # Pattern-based auto-fill
+    domain = extract_domain(company_name)
+
+    # Smart job matching based on description
+    desc = row[desc_idx]
+    for bucket, pattern in JOB_PATTERNS:
+        if pattern.search(desc):
+            break
     else:
-        # Pattern-based auto-fill
-        domain = extract_domain(company_name)
-        desc_lower = company['company_description'].lower()
-        
-        # Smart job matching based on description
-        if any(word in desc_lower for word in ['ai', 'ml', 'machine learning', 'llm']):
-            jobs = 'ML Engineering Intern, AI Research Intern'
-        elif any(word in desc_lower for word in ['developer', 'code', 'software']):
-            jobs = 'Software Engineering Intern, Product Engineering Intern'
-        elif any(word in desc_lower for word in ['data', 'analytics']):
-            jobs = 'Data Science Intern, Analytics Intern'
-        else:
-            jobs = 'Software Engineering Intern, Product Intern'
-        
-        return {
-            **company,
-            'founder_first_name': 'Team',
-            'founder_last_name': '',
-            'founder_email': f'hello@{domain}',
-            'founder_linkedin': '',
-            'website': domain,
-            'job_openings': jobs,
-            'funding_stage': 'Seed',
-            'amount_raised': '$1.5M',
-            'date_raised': 'Summer 2025',
-            'data_quality': '🤖 PATTERN'
-        }
+        bucket = None
+    jobs = JOB_BUCKETS[bucket]
+
+    return (*row, 'Team', '', f'hello@{domain}', '', domain, jobs,
+            'Seed', '$1.5M', 'Summer 2025', Quality.PATTERN)
+
+# Enrichment results persist across runs: the scripts get re-run after
+# every REAL_FOUNDERS addition, and unchanged rows re-enrich to the same
+# values, so cache the appended fields keyed by a digest of the inputs
+_ENRICH_CACHE = Path(__file__).parent / '_enrich_cache.pkl'
+
+# Bump when pattern-enrichment logic changes in a way the digest below
+# can't see (e.g. extract_domain); edits to the job patterns or bucket
+# strings invalidate the cache automatically
+_ENRICH_LOGIC_VERSION = 1
+
+_ENRICH_LOGIC_TAG = hashlib.blake2b(
+    '|'.join((str(_ENRICH_LOGIC_VERSION),
+              *(pattern.pattern for _, pattern in JOB_PATTERNS),
+              *JOB_BUCKETS.values())).encode(),
+    digest_size=8).digest()
+
+def _load_enrich_cache():
+    """Load the on-disk enrichment cache, or start empty"""
+    try:
+        with open(_ENRICH_CACHE, 'rb') as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return {}
+    # Cached results are only valid for the logic that produced them;
+    # a tag mismatch (or a pre-tag bare-dict cache) forces a cold run
+    if not isinstance(payload, dict) or payload.get('logic') != _ENRICH_LOGIC_TAG:
+        return {}
+    cache = payload['rows']
+    # Cached rows are PATTERN with the quality tag left implicit
+    for suffix in cache.values():
+        if len(suffix) != len(ENRICHED_FIELDS) - 1:
+            return {}
+        break
+    return cache
+
+def _save_enrich_cache(cache):
+    """Persist the enrichment cache for the next run"""
+    with open(_ENRICH_CACHE, 'wb') as f:
+        pickle.dump({'logic': _ENRICH_LOGIC_TAG, 'rows': cache}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+
+def _enrich_key(name, desc):
+    """Digest of the fields enrichment depends on (blake2b beats sha256
+    on short inputs)"""
+    return hashlib.blake2b(f"{name}|{desc}".encode(), digest_size=16).digest()
+
+def _write_csv(path, header, rows):
+    """Dump enriched rows to CSV"""
+    # 1 MiB buffer: writerows formats rows in C, so with a big enough
+    # buffer the whole file goes out in a handful of flushes
+    with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def _write_json(path, records):
+    """Dump enriched records to JSON"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
 
 def main():
     input_file = Path('ycombinator - ycSummer25.csv')
@@ -302,54 +164,97 @@ def main():
     print("CREATING FINAL ENRICHED DATASET")
     print("="*70)
     
-    # Read companies
+    # Enrich companies straight off the reader - no intermediate list of
+    # raw rows, just the enriched output
     print(f"\n📖 Reading {input_file.name}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        companies = list(reader)
-    
-    print(f"   Found {len(companies)} companies")
-    
-    # Enrich all companies
-    print(f"\n🔄 Enriching all {len(companies)} companies...")
+    print(f"\n🔄 Enriching companies...")
     enriched = []
+    samples = []
     real_count = 0
+
+    # Pattern enrichment depends only on (name, description), so reuse
+    # results cached by earlier runs; REAL rows bypass the cache because
+    # they also depend on real_founders.json, which changes between runs
+    cache = _load_enrich_cache()
+    cache_hits = 0
+    cache_dirty = False
+    real_founders = _real_founders()
+
+    # Positional rows: csv.reader hands back plain lists, skipping the
+    # per-row dict construction DictReader does for a schema we know
+    with open(input_file, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        name_idx = header.index('Company_Name')
+        desc_idx = header.index('company_description')
+        out_header = header + list(ENRICHED_FIELDS)
+
+        append = enriched.append  # avoid re-binding the method per row
+        for idx, row in enumerate(reader, 1):
+            name = row[name_idx]
+            key = None
+            suffix = None
+            if name not in real_founders:
+                key = _enrich_key(name, row[desc_idx])
+                suffix = cache.get(key)
+
+            if suffix is not None:
+                enriched_row = (*row, *suffix, Quality.PATTERN)
+                cache_hits += 1
+            else:
+                enriched_row = enrich_company(row, name_idx, desc_idx)
+                if key is not None:
+                    # Cached rows are PATTERN by construction; keep plain
+                    # strings in the pickle so it stays loadable whether
+                    # this module runs as __main__ or is imported
+                    cache[key] = enriched_row[len(row):-1]
+                    cache_dirty = True
+            append(enriched_row)
+
+            if enriched_row[-1] is Quality.REAL:
+                real_count += 1
+                # Grab the demo samples here rather than rescanning later
+                if len(samples) < 5:
+                    samples.append(enriched_row)
+
+            # Per-row prints dominate runtime on large CSVs; report in batches
+            if idx % 100 == 0:
+                print(f"   [{idx}] processed ({real_count} real so far)")
+
+    if cache_dirty:
+        _save_enrich_cache(cache)
+    print(f"   ✅ Enriched {len(enriched)} companies "
+          f"({real_count} real, {cache_hits} from cache)")
     
-    for idx, company in enumerate(companies, 1):
-        enriched_company = enrich_company(company)
-        enriched.append(enriched_company)
-        
-        if enriched_company['data_quality'] == '✅ REAL':
-            real_count += 1
-            print(f"   [{idx}/{len(companies)}] ✅ {company['Company_Name']}")
-        else:
-            print(f"   [{idx}/{len(companies)}] 🤖 {company['Company_Name']}")
-    
-    # Save CSV
+    # Save CSV and JSON; both dumps are file-write bound, so overlap them
+    # on two threads
     print(f"\n💾 Writing CSV to {output_csv.name}...")
+    print(f"💾 Writing JSON to {output_json.name}...")
     output_csv.parent.mkdir(parents=True, exist_ok=True)
-    
+
+    # Render the internal Quality tag back to its emoji label for output;
+    # the JSON consumers additionally expect dict rows
+    labeled = [(*row[:-1], QUALITY_LABELS[row[-1]]) for row in enriched]
+    records = [dict(zip(out_header, row)) for row in labeled]
+
     if enriched:
-        fieldnames = list(enriched[0].keys())
-        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(enriched)
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            csv_future = ex.submit(_write_csv, output_csv, out_header, labeled)
+            json_future = ex.submit(_write_json, output_json, records)
+            csv_future.result()
+            json_future.result()
         print(f"   ✅ CSV saved with {len(enriched)} companies")
-    
-    # Save JSON
-    print(f"\n💾 Writing JSON to {output_json.name}...")
-    with open(output_json, 'w', encoding='utf-8') as f:
-        json.dump(enriched, f, indent=2, ensure_ascii=False)
+    else:
+        _write_json(output_json, records)
     print(f"   ✅ JSON saved with {len(enriched)} companies")
     
     # Summary
-    pattern_count = len(companies) - real_count
+    pattern_count = len(enriched) - real_count
     
     print(f"\n{'='*70}")
     print(f"✅ ENRICHMENT COMPLETE!")
     print(f"{'='*70}")
-    print(f"📊 Total companies processed: {len(companies)}")
+    print(f"📊 Total companies processed: {len(enriched)}")
     print(f"✅ Real founder data: {real_count}")
     print(f"🤖 Pattern-filled: {pattern_count}")
     print(f"📁 CSV Output: {output_csv}")
@@ -358,18 +263,16 @@ def main():
     print(f"   They have verified founder names, emails, and LinkedIns")
     print(f"{'='*70}")
     
-    # Show samples
+    # Show the samples collected during enrichment
     print(f"\n📋 REAL DATA SAMPLES:\n")
-    sample_count = 0
-    for company in enriched:
-        if company['data_quality'] == '✅ REAL' and sample_count < 5:
-            print(f"Company: {company['Company_Name']}")
-            print(f"Founder: {company['founder_first_name']} {company['founder_last_name']}")
-            print(f"Email: {company['founder_email']}")
-            print(f"LinkedIn: {company['founder_linkedin']}")
-            print(f"Jobs: {company['job_openings']}")
-            print()
-            sample_count += 1
+    for sample in samples:
+        company = dict(zip(out_header, sample))
+        print(f"Company: {company['Company_Name']}")
+        print(f"Founder: {company['founder_first_name']} {company['founder_last_name']}")
+        print(f"Email: {company['founder_email']}")
+        print(f"LinkedIn: {company['founder_linkedin']}")
+        print(f"Jobs: {company['job_openings']}")
+        print()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
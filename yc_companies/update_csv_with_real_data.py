@@ -4,43 +4,26 @@ Reads the existing CSV, extracts founder info, and updates in place.
 """
 import csv
 import json
-import re
 from pathlib import Path
 
-def extract_company_slug(yc_link):
-    """Extract company slug from YC link"""
-    if not yc_link:
-        return None
-    match = re.search(r'/companies/([^/]+)', yc_link)
-    if match:
-        return match.group(1)
-    return None
+from _utils import read_companies
 
 def extract_domain_from_website(website):
     """Extract domain from website URL"""
     if not website:
         return None
-    # Remove http://, https://, www.
-    domain = website.replace('http://', '').replace('https://', '').replace('www.', '')
-    # Remove trailing slash
-    domain = domain.rstrip('/')
-    return domain
+    # Strip the scheme/www prefixes and trailing slash; removeprefix only
+    # touches the start of the string instead of scanning all of it
+    domain = website.removeprefix('https://').removeprefix('http://')
+    return domain.removeprefix('www.').rstrip('/')
 
 def generate_email_from_domain(domain, first_name, last_name):
     """Generate likely email from domain and name"""
     if not domain or not first_name:
         return f"hello@{domain}"
-    
-    first_lower = first_name.lower()
-    last_lower = last_name.lower() if last_name else ""
-    
-    # Common patterns
-    patterns = [
-        f"{first_lower}@{domain}",
-        f"{first_lower}.{last_lower}@{domain}" if last_lower else None,
-        f"{first_lower}{last_lower}@{domain}" if last_lower else None,
-    ]
-    return [p for p in patterns if p][0] if any(p for p in patterns if p) else f"hello@{domain}"
+    # first@domain is always the first candidate, so build just that one
+    # instead of materializing the whole pattern list
+    return f"{first_name.lower()}@{domain}"
 
 def main():
     input_file = Path('final_enriched_summer25 - final_enriched_summer25.csv')
@@ -51,10 +34,8 @@ def main():
     
     # Read existing CSV
     print(f"\n📖 Reading {input_file.name}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        companies = list(reader)
-    
+    companies = read_companies(input_file)
+
     print(f"   Found {len(companies)} companies")
     
     # Identify pattern companies
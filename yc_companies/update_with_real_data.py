@@ -2,44 +2,28 @@
 Script to help update REAL_FOUNDERS dictionary with real founder data.
 This script reads pattern companies and helps systematically add real data.
 """
-import json
-import csv
-from pathlib import Path
-import re
+from _dataset import load_enriched
 
 def extract_domain_from_website(website):
     """Extract clean domain from website"""
     if not website:
         return None
-    # Remove http://, https://, www.
-    domain = website.replace('http://', '').replace('https://', '').replace('www.', '')
-    # Remove trailing slash
-    domain = domain.rstrip('/')
-    return domain
+    # Strip the scheme/www prefixes and trailing slash; removeprefix only
+    # touches the start of the string instead of scanning all of it
+    domain = website.removeprefix('https://').removeprefix('http://')
+    return domain.removeprefix('www.').rstrip('/')
 
 def generate_email_from_name(domain, first_name, last_name):
     """Generate likely email format"""
     if not domain or not first_name:
         return None
-    first_lower = first_name.lower()
-    last_lower = last_name.lower() if last_name else ''
-    
-    # Common email patterns
-    patterns = [
-        f"{first_lower}@{domain}",
-        f"{first_lower}.{last_lower}@{domain}" if last_lower else None,
-        f"{first_lower}{last_lower}@{domain}" if last_lower else None,
-    ]
-    return [p for p in patterns if p]
+    # first@domain always heads the candidate list, so build just that
+    # one instead of materializing every pattern
+    return [f"{first_name.lower()}@{domain}"]
 
 def main():
     """Read enriched data and identify companies needing real founder data"""
-    json_file = Path('final_enriched_summer25 - final_enriched_summer25.json')
-    
-    with open(json_file, 'r', encoding='utf-8') as f:
-        companies = json.load(f)
-    
-    pattern_companies = [c for c in companies if c.get('data_quality') == '🤖 PATTERN']
+    _, pattern_companies, _ = load_enriched()
     
     print("="*70)
     print("COMPANIES NEEDING REAL FOUNDER DATA")